@@ -11,15 +11,32 @@ Dependencies:
 - yfinance (for Bitcoin data)
 - fredapi (for Fed data)
 - python-dotenv (for environment variables)
+- orjson (optional, for faster JSON reading and writing)
+- pysimdjson (optional, for faster validation of the data files)
+- ijson (optional, for streaming validation of the data files)
+- pyarrow (optional, for exporting the data files in Arrow format)
+- xxhash (optional, for faster detection of unchanged files)
 """
 
 import os
 import json
+import mmap
+import heapq
 import time
+import asyncio
+import argparse
 import datetime
+import contextlib
+import hashlib
+import functools
+import itertools
+import importlib.util
+import threading
+import concurrent.futures
 import requests
+import numpy as np
 import pandas as pd
-from dateutil.relativedelta import relativedelta
+from operator import itemgetter
 
 # Try to import optional dependencies
 try:
@@ -45,122 +62,556 @@ except ImportError:
     HAS_DOTENV = False
     print("Warning: python-dotenv not installed. Will use hardcoded API keys.")
 
+# orjson only speeds up JSON handling, so fall back to the json module silently
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pysimdjson lets the integrity check validate files without building Python objects
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
+# ijson lets the integrity check stream through files instead of loading them
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# pyarrow is only needed for the optional Arrow export, which goes through
+# pandas, so just check that it is installed
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# xxhash only speeds up the unchanged-file check, so fall back to hashlib silently
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 # Configuration
 # Read API keys from environment variables or use default (which won't work)
 FRED_API_KEY = os.getenv("FRED_API_KEY", "YOUR_FRED_API_KEY")
 ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY", "")
 DATA_DIR = "data"
+DATE_FMT = "%Y-%m-%d"  # Format of the "date" field in every data file
 ISM_API_URL = "https://api.stlouisfed.org/fred/series/observations"
+CACHE_DIR = "cache"  # Machine-local state that isn't committed with the data files
+META_FILENAME = "sync_meta.json"  # Sync cursors for the data files, kept in CACHE_DIR
+META_LOCK = threading.Lock()  # The updater threads all record their cursors in the same file
+PRETTY_JSON = False  # Data files are read by the front end, so they're written compact unless --pretty is given
+
+# Limit on FRED requests in flight at once, to stay within the API's rate limit
+FRED_MAX_CONCURRENT = 3
+FRED_SEMAPHORE = threading.BoundedSemaphore(FRED_MAX_CONCURRENT)
+
+# Yahoo Finance tickers fetched together in one download: ticker -> (filename, default start date)
+YAHOO_SERIES = {
+    "BTC-USD": ("bitcoin_price.json", "2010-07-01"),
+    "^IXIC": ("nasdaq.json", "1990-01-01"),
+}
+
+# Downloaded Yahoo Finance frames waiting to be picked up by their updater:
+# ticker -> (start date the frame was downloaded from, frame).
+# yf.download also keeps its results in module-level state, so all access
+# from the updater threads goes through the lock
+YAHOO_DOWNLOADS = {}
+YFINANCE_LOCK = threading.Lock()
+
+# Content hash of each data file as last read or written: filename -> (mtime_ns, size, hash).
+# Lets write_json skip files whose content wouldn't change
+FILE_HASHES = {}
 
 
 def ensure_data_dir():
     """Make sure the data directory exists"""
-    if not os.path.exists(DATA_DIR):
-        os.makedirs(DATA_DIR)
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+
+def loads_json(content):
+    """Parse JSON content, using orjson when available"""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which the json module accepts and
+            # older data files may contain, so only give up if json fails too
+            pass
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    return json.loads(content)
+
+
+def dumps_json(data):
+    """Serialize data to JSON bytes (indented if PRETTY_JSON is set), using orjson when available"""
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def validate_json_file(filepath):
+    """Parse a JSON file without keeping the result, raising ValueError if it is invalid"""
+    with open(filepath, 'rb') as f:
+        try:
+            if HAS_SIMDJSON:
+                # Validate the whole document in native code; the parsed result is
+                # only a view into the parser, so no Python objects are built
+                parser = simdjson.Parser()
+                parser.parse(f.read())
+                return
+            
+            if HAS_IJSON:
+                # Stream through the array one record at a time so memory use stays constant
+                try:
+                    for _ in ijson.items(f, "item", use_float=True):
+                        pass
+                except ijson.JSONError as e:
+                    raise ValueError(str(e)) from e
+                return
+        except ValueError:
+            # These validators reject NaN and Infinity, which loads_json accepts,
+            # so only report the file as invalid if loads_json fails too
+            f.seek(0)
+        
+        # Otherwise parse straight from the mapped file instead of reading a copy into memory
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as content:
+                loads_json(content)
+
+
+def content_hash(content):
+    """Return a fast, non-cryptographic hash of file content"""
+    if HAS_XXHASH:
+        return xxhash.xxh64(content).intdigest()
+    return hashlib.blake2b(content, digest_size=8).digest()
+
+
+def remember_file_hash(filename, content, stat):
+    """Record the hash of a data file's content along with the stat it was taken at"""
+    FILE_HASHES[filename] = (stat.st_mtime_ns, stat.st_size, content_hash(content))
 
 
 def read_existing_json(filename):
     """Read an existing JSON file and return its data"""
     filepath = os.path.join(DATA_DIR, filename)
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            print(f"Error reading {filename}: {e}")
-            print(f"The file may be corrupted. Creating a backup and starting fresh.")
-            # Create a backup of the corrupted file
-            backup_path = f"{filepath}.bak"
-            os.rename(filepath, backup_path)
-            return []
-    return []
+    try:
+        with open(filepath, 'rb') as f:
+            content = f.read()
+            remember_file_hash(filename, content, os.fstat(f.fileno()))
+        return loads_json(content)
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError as e:
+        print(f"Error reading {filename}: {e}")
+        print(f"The file may be corrupted. Creating a backup and starting fresh.")
+        # Create a backup of the corrupted file
+        backup_path = f"{filepath}.bak"
+        os.replace(filepath, backup_path)
+        return []
+
+
+def file_holds(filename, content):
+    """Return whether a data file, unmodified since it was last read or written, holds exactly content"""
+    known = FILE_HASHES.get(filename)
+    if not known:
+        return False
+    try:
+        stat = os.stat(os.path.join(DATA_DIR, filename))
+    except FileNotFoundError:
+        return False
+    return (stat.st_mtime_ns, stat.st_size) == known[:2] and content_hash(content) == known[2]
 
 
 def write_json(data, filename):
-    """Write data to a JSON file"""
+    """Write data to a JSON file, returning whether the data is now on disk"""
     filepath = os.path.join(DATA_DIR, filename)
     # First write to a temporary file to avoid corrupting the original
     temp_filepath = f"{filepath}.tmp"
     try:
-        with open(temp_filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Serialize before opening the file, then write it in a single call
+        content = dumps_json(data)
+        
+        # Skip the write if the file still holds exactly this content
+        if file_holds(filename, content):
+            return True
+        
+        with open(temp_filepath, 'wb') as f:
+            f.write(content)
+        
+        # If successful, atomically replace the actual file
+        os.replace(temp_filepath, filepath)
+        remember_file_hash(filename, content, os.stat(filepath))
         
-        # If successful, rename to the actual file
-        if os.path.exists(filepath):
-            os.replace(temp_filepath, filepath)
-        else:
-            os.rename(temp_filepath, filepath)
-            
         print(f"Updated {filename} with {len(data)} records")
+        return True
     except Exception as e:
         print(f"Error writing {filename}: {e}")
-        if os.path.exists(temp_filepath):
+        with contextlib.suppress(FileNotFoundError):
             os.remove(temp_filepath)
+        return False
 
 
-def update_bitcoin_price():
-    """Update Bitcoin price data using yfinance"""
-    if not HAS_YFINANCE:
-        return
+def append_json(new_data, filename):
+    """Append records to an existing JSON array file in place"""
+    filepath = os.path.join(DATA_DIR, filename)
+    # Format the records the same way dumps_json lays out array items
+    if PRETTY_JSON:
+        records = b",\n".join(b"  " + dumps_json(item).replace(b"\n", b"\n  ") for item in new_data)
+        appended = b",\n" + records + b"\n]"
+    else:
+        appended = b"," + b",".join(dumps_json(item) for item in new_data) + b"]"
     
-    print("Updating Bitcoin price data...")
+    with open(filepath, 'r+b') as f:
+        # Find the closing bracket and the end of the last record before it
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 64))
+        tail = f.read()
+        bracket = tail.rfind(b"]")
+        if bracket == -1:
+            raise ValueError(f"{filename} does not end with a JSON array")
+        
+        # Overwrite the closing bracket with the new records and close the array again
+        f.seek(size - len(tail) + len(tail[:bracket].rstrip()))
+        f.write(appended)
+        f.truncate()
+
+
+def save_json(data, filename, stored_data):
+    """
+    Write data to a JSON file, given the records currently stored in it.
+    Only the new records are appended when data just extends stored_data,
+    and nothing is written at all when data is unchanged. The file is
+    rewritten in full when it isn't laid out the way dumps_json currently
+    writes it (e.g. after switching --pretty on or off). Returns whether
+    the data is now on disk.
+    """
+    stored_count = len(stored_data)
+    if (stored_data and len(data) >= stored_count and data[:stored_count] == stored_data
+            and file_holds(filename, dumps_json(stored_data))):
+        if len(data) == stored_count:
+            return True
+        try:
+            append_json(data[stored_count:], filename)
+            print(f"Updated {filename} with {len(data)} records ({len(data) - stored_count} appended)")
+            return True
+        except Exception as e:
+            print(f"Error appending to {filename}: {e}")
+            print("Rewriting the whole file instead.")
     
-    # Read existing data
-    existing_data = read_existing_json("bitcoin_price.json")
+    return write_json(data, filename)
+
+
+def read_meta():
+    """Read the sync metadata kept in the cache directory"""
+    try:
+        with open(os.path.join(CACHE_DIR, META_FILENAME), 'rb') as f:
+            return loads_json(f.read())
+    except (FileNotFoundError, json.JSONDecodeError):
+        # Without usable metadata the updaters just read the data files again
+        return {}
+
+
+def write_meta(meta):
+    """Write the sync metadata kept in the cache directory"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    filepath = os.path.join(CACHE_DIR, META_FILENAME)
+    temp_filepath = f"{filepath}.tmp"
+    with open(temp_filepath, 'wb') as f:
+        f.write(dumps_json(meta))
+    os.replace(temp_filepath, filepath)
+
+
+def get_sync_cursor(meta, filename):
+    """
+    Return the sync cursor recorded for a data file, or None if there isn't one
+    or the file has been modified since it was recorded.
+    """
+    cursor = meta.get(filename)
+    if not cursor:
+        return None
     
-    # Clean data file first to remove any corrupted data
-    existing_data = clean_data_file(existing_data, "bitcoin_price.json")
+    try:
+        stat = os.stat(os.path.join(DATA_DIR, filename))
+    except FileNotFoundError:
+        return None
+    if stat.st_mtime_ns != cursor.get("mtime_ns") or stat.st_size != cursor.get("size"):
+        return None
+    # Records are appended in the current layout, so the file must already use it
+    if cursor.get("pretty") != PRETTY_JSON:
+        return None
+    return cursor
+
+
+def record_sync_cursor(filename, latest_date, count, **extra):
+    """Record the sync cursor for a data file that has just been cleaned or written"""
+    stat = os.stat(os.path.join(DATA_DIR, filename))
+    with META_LOCK:
+        meta = read_meta()
+        meta[filename] = {
+            "last_sync": datetime.date.today().isoformat(),
+            "latest_date": latest_date,
+            "count": count,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "pretty": PRETTY_JSON,
+            **extra,
+        }
+        write_meta(meta)
+
+
+def store_new_data(filename, new_data, cursor, stored_data=None, existing_data=None):
+    """
+    Add cleaned new records, all dated after the existing ones, to a data file
+    and record its sync cursor. With a valid cursor the records are appended to
+    the file as it is on disk; otherwise they are merged into existing_data
+    (the cleaned version of stored_data) and the file is saved. The cursor is
+    only recorded once the data is on disk, and a failed append is raised.
+    """
+    if cursor:
+        if not new_data:
+            return
+        
+        append_json(new_data, filename)
+        count = cursor["count"] + len(new_data)
+        latest_date = new_data[-1]["date"]
+        print(f"Updated {filename} with {count} records ({len(new_data)} appended)")
+    else:
+        # Combine existing and new data, keeping it sorted by date
+        updated_data = merge_sorted(existing_data, new_data)
+        if not updated_data:
+            return
+        
+        # Write updated data (only rewritten if something changed); if the
+        # write failed, leave the cursor alone so the next run fetches these rows again
+        if not save_json(updated_data, filename, stored_data):
+            return
+        count = len(updated_data)
+        latest_date = updated_data[-1]["date"]
     
-    # Find the most recent date in the existing data
-    if existing_data:
-        latest_date = max(item["date"] for item in existing_data)
-        start_date = (datetime.datetime.strptime(latest_date, "%Y-%m-%d") + 
-                      datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+    record_sync_cursor(filename, latest_date, count)
+
+
+def sync_series(filename, fetch_fn, default_start="1990-01-01", meta=None):
+    """
+    Incrementally update a data file. fetch_fn(start_date) returns the records
+    after the latest date in the file, or None if there is nothing to fetch;
+    the new records are cleaned and added to the file, and returned.
+    """
+    cursor = get_sync_cursor(read_meta() if meta is None else meta, filename)
+    stored_data = existing_data = None
+    if cursor:
+        # The file is unchanged since it was last cleaned and written,
+        # so continue from the recorded cursor without reading it at all
+        latest_date = cursor["latest_date"]
     else:
-        # If no existing data, start from 2010
-        start_date = "2010-07-01"
+        # Read existing data
+        stored_data = read_existing_json(filename)
+        
+        # Clean data file first to remove any corrupted data, and sort it so the
+        # latest date is at the end and the new records can be merged in
+        existing_data = clean_data_file(stored_data, filename, sort=True)
+        latest_date = existing_data[-1]["date"] if existing_data else None
+    
+    # Fetch from the day after the latest date, or from the default date if there's no data yet
+    start_date = next_day_iso(latest_date) if latest_date else default_start
+    new_data = fetch_fn(start_date)
+    if new_data is None:
+        return None
+    
+    # Only the new rows need cleaning; the existing data was cleaned above or when it was written
+    new_data = clean_data_file(new_data, filename)
+    
+    # Add the new data to the file
+    store_new_data(filename, new_data, cursor, stored_data, existing_data)
+    return new_data
+
+
+@functools.lru_cache(maxsize=None)
+def next_day_iso(date_str):
+    """Return the ISO date of the day after an ISO date string"""
+    return (datetime.date.fromisoformat(date_str) + datetime.timedelta(days=1)).isoformat()
+
+
+def index_by_date(data):
+    """Map each date in a list of records to its position in the list"""
+    return {item["date"]: i for i, item in enumerate(data)}
+
+
+def update_by_date(data, new_data, date_map):
+    """
+    Update data in place with new_data, given date_map from index_by_date(data).
+    Records for dates already in data get the new value; the others are appended.
+    """
+    for new_item in new_data:
+        idx = date_map.setdefault(new_item["date"], len(data))
+        if idx == len(data):
+            data.append(new_item)
+        else:
+            data[idx]["value"] = new_item["value"]
+
+
+def merge_sorted(existing_data, new_data):
+    """
+    Return existing_data merged with new_data in date order.
+    existing_data must already be sorted by date; when a date appears more than
+    once only the first record is kept, so existing records win over new ones.
+    """
+    key = itemgetter("date")
+    merged = heapq.merge(existing_data, sorted(new_data, key=key), key=key)
+    return [next(group) for _, group in itertools.groupby(merged, key=key)]
+
+
+def series_to_records(series, decimals=None):
+    """Convert a date-indexed Series into date/value records, skipping missing or infinite values"""
+    if series.empty:
+        return []
+    
+    # Work on whole columns rather than converting row by row
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    dates = series.index.strftime(DATE_FMT).to_numpy()
+    mask = np.isfinite(values)
+    values = values[mask]
+    if decimals is not None:
+        values = np.round(values, decimals)
+    
+    return [{"date": date, "value": value} for date, value in zip(dates[mask].tolist(), values.tolist())]
+
+
+def scale_values(data, scale, decimals=1):
+    """Multiply every value in a list of date/value records by scale"""
+    values = np.array([item["value"] for item in data], dtype=np.float64)
+    scaled = np.round(values * scale, decimals)
+    return [{"date": item["date"], "value": value} for item, value in zip(data, scaled.tolist())]
+
+
+def _fetch_yahoo_bulk(start_dates):
+    """Download monthly data for several Yahoo Finance tickers in a single request"""
+    min_start = min(start_dates.values())
+    data = yf.download(" ".join(start_dates), start=min_start, interval="1mo",
+                       group_by="ticker", threads=True, progress=False)
+    
+    # Split the multi-ticker frame back into one frame per ticker
+    frames = {}
+    for ticker, start_date in start_dates.items():
+        if data.empty or ticker not in data.columns.get_level_values(0):
+            frames[ticker] = pd.DataFrame(index=pd.DatetimeIndex([]))
+        else:
+            frames[ticker] = data[ticker].loc[start_date:].dropna(how="all")
     
+    return frames
+
+
+def get_yahoo_data(ticker, start_date):
+    """Get monthly Yahoo Finance data for a ticker, downloading all YAHOO_SERIES at once"""
+    with YFINANCE_LOCK:
+        # A frame downloaded along with another ticker got its start date from the
+        # raw data file, so it may start after the date this updater needs
+        cached = YAHOO_DOWNLOADS.get(ticker)
+        if cached and cached[0] > start_date:
+            del YAHOO_DOWNLOADS[ticker]
+        
+        if ticker not in YAHOO_DOWNLOADS:
+            start_dates = {ticker: start_date}
+            
+            # Include the other tickers that haven't been fetched yet, starting
+            # from the day after the latest date in their data files
+            meta = read_meta()
+            today = datetime.date.today().isoformat()
+            for other, (filename, default_start) in YAHOO_SERIES.items():
+                if other in start_dates or other in YAHOO_DOWNLOADS:
+                    continue
+                cursor = get_sync_cursor(meta, filename)
+                if cursor:
+                    latest_date = cursor["latest_date"]
+                else:
+                    existing_data = read_existing_json(filename)
+                    latest_date = existing_data[-1]["date"] if existing_data else None
+                other_start = next_day_iso(latest_date) if latest_date else default_start
+                
+                # Leave out tickers that are already up to date; their updater
+                # returns without asking for a frame, so it would never be picked up
+                if other_start < today:
+                    start_dates[other] = other_start
+            
+            for downloaded, frame in _fetch_yahoo_bulk(start_dates).items():
+                YAHOO_DOWNLOADS[downloaded] = (start_dates[downloaded], frame)
+        
+        # Hand the frame over so a later call downloads fresh data
+        return YAHOO_DOWNLOADS.pop(ticker)[1]
+
+
+def _fetch_yahoo_records(ticker, name, start_date):
+    """Fetch the monthly closing prices of a YAHOO_SERIES ticker from start_date up to today"""
     # Get end date (today)
-    end_date = datetime.datetime.now().strftime("%Y-%m-%d")
+    end_date = datetime.date.today().isoformat()
     
     # If start date is after or equal to end date, no update needed
     if start_date >= end_date:
-        print("Bitcoin price data is already up to date.")
-        return
+        print(f"{name} data is already up to date.")
+        return None
+    
+    # Fetch data from Yahoo Finance
+    price_data = get_yahoo_data(ticker, start_date)
+    price_data = price_data[(price_data.index >= start_date) & (price_data.index < end_date)]
+    
+    # If no new data, return
+    if price_data.empty:
+        print(f"No new {name} data available.")
+        return None
     
-    # Fetch Bitcoin data from Yahoo Finance
+    # Use the closing price for the monthly value; a single-ticker download
+    # may still return it as a one-column frame
+    closes = price_data["Close"]
+    if isinstance(closes, pd.DataFrame):
+        closes = closes.iloc[:, 0]
+    
+    # Process the data, skipping missing prices
+    return series_to_records(closes)
+
+
+def _update_from_yahoo(ticker, name):
+    """Update the monthly price data file for one of the YAHOO_SERIES tickers"""
+    filename, default_start = YAHOO_SERIES[ticker]
     try:
-        btc_data = yf.download("BTC-USD", start=start_date, end=end_date, interval="1mo")
-        
-        # If no new data, return
-        if btc_data.empty:
-            print("No new Bitcoin data available.")
-            return
-        
-        # Process the data
-        new_data = []
-        for date_idx in btc_data.index:
-            # Use the closing price for the monthly value and convert to proper Python float
-            # Fix for FutureWarning: Use iloc[0] instead of directly converting Series to float
-            new_data.append({
-                "date": date_idx.strftime("%Y-%m-%d"),
-                "value": float(btc_data.loc[date_idx, "Close"].iloc[0]) if hasattr(btc_data.loc[date_idx, "Close"], "iloc") else float(btc_data.loc[date_idx, "Close"])
-            })
-        
-        # Combine existing and new data
-        updated_data = existing_data + new_data
-        
-        # Sort by date
-        updated_data.sort(key=lambda x: x["date"])
-        
-        # Clean data one more time to ensure no duplicates
-        updated_data = clean_data_file(updated_data, "bitcoin_price.json")
-        
-        # Write updated data
-        write_json(updated_data, "bitcoin_price.json")
-        
+        sync_series(filename, functools.partial(_fetch_yahoo_records, ticker, name), default_start)
     except Exception as e:
-        print(f"Error updating Bitcoin price data: {e}")
+        print(f"Error updating {name} data: {e}")
+
+
+def update_bitcoin_price():
+    """Update Bitcoin price data using yfinance"""
+    if not HAS_YFINANCE:
+        return
+    
+    print("Updating Bitcoin price data...")
+    _update_from_yahoo("BTC-USD", "Bitcoin price")
+
+
+@functools.lru_cache(maxsize=None)
+def get_fred_client():
+    """Return the FRED API client shared by all FRED requests"""
+    return Fred(api_key=FRED_API_KEY)
+
+
+def _fetch_fred_records(fred, series_id, start_date):
+    """Fetch new observations for a single FRED series"""
+    # Get data up to today
+    with FRED_SEMAPHORE:
+        df = fred.get_series(series_id, start_date)
+    
+    # Process the data, skipping NaN values
+    return series_to_records(df, decimals=2)
 
 
 def update_fred_data():
@@ -175,8 +626,8 @@ def update_fred_data():
     
     print("Updating FRED data...")
     
-    # Initialize FRED API
-    fred = Fred(api_key=FRED_API_KEY)
+    # Get the shared FRED API client
+    fred = get_fred_client()
     
     # Define series IDs for each dataset
     series_mapping = {
@@ -185,58 +636,37 @@ def update_fred_data():
         "T10Y2Y": "yield_curve.json",  # 10Y-2Y Treasury Yield Spread
     }
     
-    for series_id, filename in series_mapping.items():
-        print(f"Updating {filename}...")
+    # The series are independent, so update them concurrently
+    meta = read_meta()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(series_mapping)) as executor:
+        futures = {}
+        for series_id, filename in series_mapping.items():
+            print(f"Updating {filename}...")
+            fetch = functools.partial(_fetch_fred_records, fred, series_id)
+            futures[executor.submit(sync_series, filename, fetch, "1990-01-01", meta)] = series_id
         
-        # Read existing data
-        existing_data = read_existing_json(filename)
-        
-        # Clean data file first to remove any corrupted data
-        existing_data = clean_data_file(existing_data, filename)
-        
-        # Find the most recent date in the existing data
-        if existing_data:
-            latest_date = max(item["date"] for item in existing_data)
-            start_date = (datetime.datetime.strptime(latest_date, "%Y-%m-%d") + 
-                          datetime.timedelta(days=1)).strftime("%Y-%m-%d")
-        else:
-            # If no existing data, start from 1990
-            start_date = "1990-01-01"
-        
-        # Fetch data from FRED
-        try:
-            # Get data up to today
-            df = fred.get_series(series_id, start_date)
-            
-            # If no new data, continue to next series
-            if df.empty:
-                print(f"No new data available for {series_id}.")
-                continue
-            
-            # Process the data
-            new_data = []
-            for date, value in df.items():
-                if not pd.isna(value):  # Skip NaN values
-                    new_data.append({
-                        "date": date.strftime("%Y-%m-%d"),
-                        "value": round(float(value), 2)
-                    })
-            
-            # Combine existing and new data
-            updated_data = existing_data + new_data
-            
-            # Sort by date
-            updated_data.sort(key=lambda x: x["date"])
-            
-            # Clean data one more time to ensure no duplicates
-            updated_data = clean_data_file(updated_data, filename)
-            
-            # Write updated data
-            write_json(updated_data, filename)
-            
-        except Exception as e:
-            print(f"Error updating {series_id} data: {e}")
-            print("Check if your FRED API key is valid and has not exceeded usage limits.")
+        for future in concurrent.futures.as_completed(futures):
+            series_id = futures[future]
+            try:
+                if not future.result():
+                    print(f"No new data available for {series_id}.")
+            except Exception as e:
+                print(f"Error updating {series_id} data: {e}")
+                print("Check if your FRED API key is valid and has not exceeded usage limits.")
+
+
+def _read_ism_csv(csv_file_path):
+    """Read the ISM PMI CSV file into a frame with date and value columns"""
+    df = pd.read_csv(csv_file_path, header=0, names=["period", "value"], dtype={"period": str})
+    
+    # Convert YYYY-MM to YYYY-MM-01 format to match the JSON
+    df["date"] = pd.to_datetime(df["period"], format="%Y-%m").dt.strftime("%Y-%m-01")
+    df["value"] = df["value"].astype(float)
+    
+    # If a month is listed more than once (e.g. a revised reading), the last entry wins
+    df = df.drop_duplicates("date", keep="last")
+    
+    return df[["date", "value"]]
 
 
 def update_ism_data():
@@ -250,56 +680,54 @@ def update_ism_data():
         if os.path.exists(csv_file_path):
             print("Found ISM Manufacturing PMI CSV file, updating from local data...")
             
+            # Skip the merge if neither the CSV nor the JSON file has changed since
+            # the CSV was last merged into it
+            cursor = get_sync_cursor(read_meta(), "ISM-pmi-pm.csv")
+            if cursor:
+                with contextlib.suppress(FileNotFoundError):
+                    stat = os.stat(os.path.join(DATA_DIR, "ism_manufacturing.json"))
+                    if (stat.st_mtime_ns, stat.st_size) == (cursor.get("merged_mtime_ns"), cursor.get("merged_size")):
+                        print("ISM Manufacturing data is already up to date with the CSV file.")
+                        return
+            
             # Read existing JSON data
             existing_data = read_existing_json("ism_manufacturing.json")
             
-            # Create a map of dates to values for easy lookup and deduplication
-            existing_dict = {item['date']: item['value'] for item in existing_data}
-            
             # Read the CSV data
-            import csv
-            from datetime import datetime as dt
+            csv_data = _read_ism_csv(csv_file_path)
             
-            new_entries = []
-            updated_entries = 0
+            # Line up the CSV values with the existing values by date
+            existing_df = pd.DataFrame(existing_data, columns=["date", "value"])
+            merged = csv_data.merge(existing_df.drop_duplicates("date"), on="date",
+                                    how="left", suffixes=("_new", "_old"))
             
-            with open(csv_file_path, 'r') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header row
-                for row in reader:
-                    period, value = row
-                    # Convert YYYY-MM to YYYY-MM-01 format to match the JSON
-                    date_obj = dt.strptime(period, '%Y-%m')
-                    formatted_date = date_obj.strftime('%Y-%m-01')
-                    
-                    # Only add if the entry doesn't exist
-                    if formatted_date not in existing_dict:
-                        new_entries.append({
-                            'date': formatted_date,
-                            'value': float(value)
-                        })
-                    # If it exists but the value is different, update it
-                    elif abs(float(value) - existing_dict[formatted_date]) > 0.01:
-                        # Find the entry and update it
-                        for item in existing_data:
-                            if item['date'] == formatted_date:
-                                item['value'] = float(value)
-                                updated_entries += 1
-                                break
+            # Entries that don't exist yet, and existing entries whose value is
+            # different (allowing for small float differences)
+            is_new = merged["value_old"].isna()
+            is_updated = ~is_new & ((merged["value_new"] - merged["value_old"]).abs() > 0.01)
+            new_entries = int(is_new.sum())
+            updated_entries = int(is_updated.sum())
             
-            # Add new entries to existing data
-            existing_data.extend(new_entries)
+            # Update the changed values and add the new entries
+            updates = merged[is_updated].set_index("date")["value_new"]
+            existing_df["value"] = existing_df["date"].map(updates).fillna(existing_df["value"])
+            new_df = merged.loc[is_new, ["date", "value_new"]].rename(columns={"value_new": "value"})
+            combined = pd.concat([existing_df, new_df], ignore_index=True)
             
             # Sort by date
-            existing_data.sort(key=lambda x: x['date'])
+            combined = combined.sort_values("date", kind="stable")
             
             # Clean data to ensure no duplicates or outliers
-            cleaned_data = clean_data_file(existing_data, "ism_manufacturing.json")
+            cleaned_data = clean_data_file(combined.to_dict(orient="records"), "ism_manufacturing.json")
             
-            # Write the updated data back to the JSON file
-            write_json(cleaned_data, "ism_manufacturing.json")
+            # Write the updated data back to the JSON file if anything changed, and
+            # remember which state of the JSON file this version of the CSV went into
+            if save_json(cleaned_data, "ism_manufacturing.json", existing_data) and not csv_data.empty:
+                stat = os.stat(os.path.join(DATA_DIR, "ism_manufacturing.json"))
+                record_sync_cursor("ISM-pmi-pm.csv", csv_data["date"].max(), len(csv_data),
+                                   merged_mtime_ns=stat.st_mtime_ns, merged_size=stat.st_size)
             
-            print(f"Added {len(new_entries)} new ISM Manufacturing entries and updated {updated_entries} existing entries.")
+            print(f"Added {new_entries} new ISM Manufacturing entries and updated {updated_entries} existing entries.")
             print(f"Total entries in ISM Manufacturing data: {len(cleaned_data)}")
             
             # Return early if successful
@@ -349,9 +777,10 @@ def update_ism_data():
     print(" 3. Use TradingView data: https://www.tradingview.com/symbols/ECONOMICS-USBCOI/")
 
 
-def clean_data_file(data, filename):
+def clean_data_file(data, filename, sort=False):
     """
-    Clean data files to remove corrupted data, duplicates, and ensure values are in the correct range
+    Clean data files to remove corrupted data, duplicates, and ensure values are in the correct range.
+    With sort=True the cleaned records are also put in date order in the same pass.
     """
     print(f"Cleaning data for {filename}...")
     
@@ -369,43 +798,40 @@ def clean_data_file(data, filename):
     # Get the proper range for this file type
     min_val, max_val = value_ranges.get(filename, (None, None))
     
-    # If we don't have a range definition, just check for duplicates
-    if min_val is None or max_val is None:
-        # Remove duplicates by keeping only the first occurrence of each date
-        seen_dates = set()
-        cleaned_data = []
-        for item in data:
-            if item["date"] not in seen_dates:
-                cleaned_data.append(item)
-                seen_dates.add(item["date"])
-        
-        if len(cleaned_data) < len(data):
-            print(f"  Removed {len(data) - len(cleaned_data)} duplicate dates")
-        return cleaned_data
-    
-    # If we have a range, filter by both date uniqueness and value range
-    seen_dates = set()
-    cleaned_data = []
-    outliers_removed = 0
-    duplicates_removed = 0
-    
-    for item in data:
-        value = float(item["value"])
-        
-        # Check if the date has been seen before
-        if item["date"] in seen_dates:
-            duplicates_removed += 1
-            continue
-        
-        # Check if the value is within the acceptable range
-        if value < min_val or value > max_val:
-            outliers_removed += 1
-            print(f"  Removed outlier: {item['date']} = {value} (outside range {min_val}-{max_val})")
-            continue
-        
-        # If it's a new date and within range, keep it
-        cleaned_data.append(item)
-        seen_dates.add(item["date"])
+    if not data:
+        return []
+    
+    # Work on the dates and values as columns; the records themselves are kept as-is
+    df = pd.DataFrame(data, columns=["date", "value"])
+    values = pd.to_numeric(df["value"], errors="coerce").astype(float)
+    
+    # If we have a range, values outside of it are outliers; NaN fails neither
+    # bound check, so it is kept
+    if min_val is not None and max_val is not None:
+        in_range = values.between(min_val, max_val) | values.isna()
+    else:
+        in_range = pd.Series(True, index=df.index)
+    
+    # A record is a duplicate if an earlier in-range record has the same date,
+    # whatever its own value; only the first in-range record of each date is kept
+    first_kept = df.index.to_series()[in_range].groupby(df["date"][in_range]).first()
+    duplicates = df["date"].map(first_kept) < df.index
+    outliers = ~in_range & ~duplicates
+    keep = in_range & ~duplicates
+    duplicates_removed = int(duplicates.sum())
+    outliers_removed = int(outliers.sum())
+    
+    for date, value in zip(df["date"][outliers], values[outliers]):
+        print(f"  Removed outlier: {date} = {value} (outside range {min_val}-{max_val})")
+    
+    if sort:
+        # Order the remaining records by date; the sort is stable, so records
+        # that are already in order stay as they are
+        kept = np.flatnonzero(keep.to_numpy())
+        order = kept[np.argsort(df["date"].to_numpy()[kept], kind="stable")]
+        cleaned_data = [data[i] for i in order]
+    else:
+        cleaned_data = list(itertools.compress(data, keep.to_numpy()))
     
     if duplicates_removed > 0:
         print(f"  Removed {duplicates_removed} duplicate dates")
@@ -426,117 +852,80 @@ def get_nasdaq_data():
             write_json(existing_data, "nasdaq.json")
             print("Renamed nasdaq_index.json to nasdaq.json")
     
-    # Read existing data
-    existing_data = read_existing_json("nasdaq.json")
-    
-    # Clean data file first to remove any corrupted data
-    existing_data = clean_data_file(existing_data, "nasdaq.json")
-    
-    # Find the most recent date in the existing data
-    if existing_data:
-        latest_date = max(item["date"] for item in existing_data)
-        start_date = (datetime.datetime.strptime(latest_date, "%Y-%m-%d") + 
-                      datetime.timedelta(days=1)).strftime("%Y-%m-%d")
-    else:
-        # If no existing data, start from 1990
-        start_date = "1990-01-01"
-    
     # Get NASDAQ data from Yahoo Finance
     if HAS_YFINANCE:
-        try:
-            # Get data up to today
-            nasdaq_data = yf.download("^IXIC", start=start_date, interval="1mo")
-            
-            # If no new data, return
-            if nasdaq_data.empty:
-                print("No new NASDAQ data available.")
-                return
-            
-            # Process the data
-            new_data = []
-            for date_idx in nasdaq_data.index:
-                # Fix for FutureWarning: Use iloc[0] instead of directly converting Series to float
-                new_data.append({
-                    "date": date_idx.strftime("%Y-%m-%d"),
-                    "value": float(nasdaq_data.loc[date_idx, "Close"].iloc[0]) if hasattr(nasdaq_data.loc[date_idx, "Close"], "iloc") else float(nasdaq_data.loc[date_idx, "Close"])
-                })
-            
-            # Combine existing and new data
-            updated_data = existing_data + new_data
-            
-            # Sort by date
-            updated_data.sort(key=lambda x: x["date"])
-            
-            # Clean data one more time to ensure no duplicates
-            updated_data = clean_data_file(updated_data, "nasdaq.json")
-            
-            # Write updated data
-            write_json(updated_data, "nasdaq.json")
-            
-        except Exception as e:
-            print(f"Error updating NASDAQ data: {e}")
+        _update_from_yahoo("^IXIC", "NASDAQ")
     else:
         print("yfinance not installed. Cannot update NASDAQ data.")
 
 
+def _generate_yoy_file(price_filename, yoy_filename):
+    """Calculate the YoY returns for one price data file and write them"""
+    price_data = read_existing_json(price_filename)
+    if price_data:
+        # Earlier returns don't change when new prices come in, so usually
+        # only the latest returns need to be appended to the file
+        save_json(calculate_yoy_returns(price_data), yoy_filename, read_existing_json(yoy_filename))
+
+
 def generate_yoy_returns():
     """Generate Year-over-Year returns for Bitcoin and NASDAQ"""
     print("Generating YoY returns data...")
     
-    # Generate YoY returns for Bitcoin
-    bitcoin_data = read_existing_json("bitcoin_price.json")
-    if bitcoin_data:
-        bitcoin_yoy = calculate_yoy_returns(bitcoin_data)
-        write_json(bitcoin_yoy, "bitcoin_yoy.json")
+    # Price data file -> YoY returns file
+    yoy_files = {
+        "bitcoin_price.json": "bitcoin_yoy.json",
+        "nasdaq.json": "nasdaq_yoy.json",
+    }
     
-    # Generate YoY returns for NASDAQ
-    nasdaq_data = read_existing_json("nasdaq.json")
-    if nasdaq_data:
-        nasdaq_yoy = calculate_yoy_returns(nasdaq_data)
-        write_json(nasdaq_yoy, "nasdaq_yoy.json")
+    # The files are independent, so read, calculate and write them concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(yoy_files)) as executor:
+        futures = [
+            executor.submit(_generate_yoy_file, price_filename, yoy_filename)
+            for price_filename, yoy_filename in yoy_files.items()
+        ]
+        for future in futures:
+            future.result()
 
 
 def calculate_yoy_returns(price_data):
     """Calculate Year-over-Year returns for a price dataset"""
-    # Sort data by date
-    sorted_data = sorted(price_data, key=lambda x: x["date"])
+    if not price_data:
+        return []
     
-    # Initialize result list
-    yoy_data = []
+    # Build a date-sorted frame, keeping the original date strings for output
+    df = pd.DataFrame(price_data, columns=["date", "value"])
+    df["timestamp"] = pd.to_datetime(df["date"], format=DATE_FMT)
+    df = df.sort_values("timestamp", kind="stable")
     
-    # For each data point, find the value 1 year ago and calculate YoY return
-    for i, current in enumerate(sorted_data):
-        current_date = datetime.datetime.strptime(current["date"], "%Y-%m-%d")
-        target_date = current_date - relativedelta(years=1)
-        
-        # Find the closest data point to 1 year ago
-        closest_idx = None
-        min_diff = datetime.timedelta(days=365)
-        
-        for j, past in enumerate(sorted_data[:i]):
-            past_date = datetime.datetime.strptime(past["date"], "%Y-%m-%d")
-            diff = abs(past_date - target_date)
-            
-            if diff < min_diff:
-                min_diff = diff
-                closest_idx = j
-        
-        # If we found a data point close enough to 1 year ago (within 45 days)
-        if closest_idx is not None and min_diff <= datetime.timedelta(days=45):
-            past_value = sorted_data[closest_idx]["value"]
-            current_value = current["value"]
-            
-            # Calculate YoY return as percentage
-            if past_value > 0:  # Avoid division by zero
-                yoy_return = ((current_value / past_value) - 1) * 100
-                
-                # Add to result
-                yoy_data.append({
-                    "date": current["date"],
-                    "value": round(yoy_return, 2)
-                })
+    # Index the values by date, so the point exactly one year earlier is a direct lookup
+    by_date = df.drop_duplicates("timestamp").set_index("timestamp")["value"]
+    df["target"] = df["timestamp"] - pd.DateOffset(years=1)
+    if len(df) >= 3 and pd.infer_freq(df["timestamp"]) == "MS":
+        # Evenly spaced month starts: the point a year earlier is always 12 rows back
+        df["past_value"] = df["value"].shift(12)
+    else:
+        df["past_value"] = df["target"].map(by_date)
+    
+    # Match the remaining points with the closest one to the date a year
+    # earlier (within 45 days); on a tie the earlier point is used
+    missing = df["past_value"].isna()
+    if missing.any():
+        past = by_date.rename("past_value").rename_axis("target").reset_index()
+        nearest = pd.merge_asof(df.loc[missing, ["target"]], past, on="target",
+                                direction="nearest", tolerance=pd.Timedelta(days=45))
+        df.loc[missing, "past_value"] = nearest["past_value"].to_numpy()
+    
+    # Avoid division by zero (this also drops points without a match)
+    values = df["value"].to_numpy(dtype=np.float64)
+    past_values = df["past_value"].to_numpy(dtype=np.float64)
+    valid = past_values > 0
     
-    return yoy_data
+    # Calculate YoY return as percentage
+    returns = np.round((values[valid] / past_values[valid] - 1) * 100, 2)
+    dates = df["date"].to_numpy()[valid]
+    
+    return [{"date": date, "value": value} for date, value in zip(dates.tolist(), returns.tolist())]
 
 
 def check_data_integrity():
@@ -560,16 +949,16 @@ def check_data_integrity():
         filepath = os.path.join(DATA_DIR, filename)
         if os.path.exists(filepath):
             try:
-                with open(filepath, 'r') as f:
-                    json.load(f)
+                validate_json_file(filepath)
                 print(f"✓ {filename} is valid")
-            except json.JSONDecodeError as e:
+            except ValueError as e:
+                # Covers JSON decode errors as well as empty files, which can't be mapped
                 print(f"✗ {filename} is corrupted: {e}")
                 print(f"  Creating backup and attempting repair...")
                 
                 # Create a backup
                 backup_path = f"{filepath}.bak"
-                os.rename(filepath, backup_path)
+                os.replace(filepath, backup_path)
                 
                 # Try to read the file with error handling
                 try:
@@ -581,11 +970,11 @@ def check_data_integrity():
                         content += "\n]"
                     
                     # Try to parse the fixed content
-                    fixed_data = json.loads(content)
+                    fixed_data = loads_json(content)
                     
                     # Write the fixed data
-                    with open(filepath, 'w') as f:
-                        json.dump(fixed_data, f, indent=2)
+                    with open(filepath, 'wb') as f:
+                        f.write(dumps_json(fixed_data))
                     
                     print(f"  ✓ {filename} successfully repaired")
                 except Exception as repair_error:
@@ -631,23 +1020,18 @@ def fix_m2_data():
         
         if HAS_FRED and FRED_API_KEY and FRED_API_KEY != "YOUR_FRED_API_KEY":
             print("Using FRED API to fetch complete M2SL series...")
-            fred = Fred(api_key=FRED_API_KEY)
-            m2_data = fred.get_series('M2SL', observation_start='1959-01-01')
+            fred = get_fred_client()
+            with FRED_SEMAPHORE:
+                m2_data = fred.get_series('M2SL', observation_start='1959-01-01')
             
             # Format data
-            corrected_data = []
-            for date_str, value in m2_data.items():
-                date_str = date_str.strftime('%Y-%m-%d')
-                corrected_data.append({
-                    "date": date_str,
-                    "value": float(value)
-                })
+            corrected_data = series_to_records(m2_data)
             
             # Sort by date
-            corrected_data.sort(key=lambda x: x["date"])
+            corrected_data.sort(key=itemgetter("date"))
             
-            # Write to file
-            write_json(corrected_data, "global_m2.json")
+            # Write to file (only the new records if the rest is unchanged)
+            save_json(corrected_data, "global_m2.json", existing_data)
             
             print(f"M2 data fixed with {len(corrected_data)} records from FRED API.")
         else:
@@ -655,7 +1039,7 @@ def fix_m2_data():
             print("Using manual update with recent known M2SL values...")
             
             # Create a map of existing dates to positions
-            existing_date_map = {item["date"]: i for i, item in enumerate(existing_data)}
+            existing_date_map = index_by_date(existing_data)
             
             # Latest known M2SL values from FRED (as of Feb 2025)
             # Source: https://fred.stlouisfed.org/series/M2SL
@@ -715,19 +1099,15 @@ def fix_m2_data():
                     print("Rescaling existing data using multiple reference points...")
                     
                     # Use multiple points to create a more accurate scaling model
-                    scaled_data = []
-                    
                     # Find reference dates in existing data
-                    reference_dates = list(historical_references.keys())
                     reference_scales = {}
                     
-                    for ref_date in reference_dates:
-                        for item in existing_data:
-                            if item["date"] == ref_date:
-                                if item["value"] > 0:  # Avoid division by zero
-                                    ref_scale = historical_references[ref_date] / item["value"]
-                                    reference_scales[ref_date] = ref_scale
-                                break
+                    for ref_date, ref_value in historical_references.items():
+                        idx = existing_date_map.get(ref_date)
+                        if idx is not None:
+                            item = existing_data[idx]
+                            if item["value"] > 0:  # Avoid division by zero
+                                reference_scales[ref_date] = ref_value / item["value"]
                     
                     if reference_scales:
                         # Calculate average scaling factor
@@ -735,11 +1115,7 @@ def fix_m2_data():
                         print(f"Using average scaling factor of {avg_scale:.2f} across {len(reference_scales)} reference points")
                         
                         # Apply average scaling to all items
-                        for item in existing_data:
-                            scaled_data.append({
-                                "date": item["date"],
-                                "value": round(item["value"] * avg_scale, 1)
-                            })
+                        scaled_data = scale_values(existing_data, avg_scale)
                     else:
                         # Fallback: use last item scaling
                         latest_known = recent_m2_values[-1]["value"]
@@ -747,24 +1123,13 @@ def fix_m2_data():
                         scale = latest_known / latest_existing
                         print(f"Using single scaling factor of {scale:.2f} based on latest value")
                         
-                        for item in existing_data:
-                            scaled_data.append({
-                                "date": item["date"],
-                                "value": round(item["value"] * scale, 1)
-                            })
+                        scaled_data = scale_values(existing_data, scale)
                     
                     # Now update with the known recent and historical values for accuracy
-                    for new_item in recent_m2_values:
-                        for i, item in enumerate(scaled_data):
-                            if item["date"] == new_item["date"]:
-                                scaled_data[i]["value"] = new_item["value"]
-                                break
-                        else:
-                            # If not found, add it
-                            scaled_data.append(new_item)
+                    update_by_date(scaled_data, recent_m2_values, index_by_date(scaled_data))
                     
                     # Sort by date
-                    scaled_data.sort(key=lambda x: x["date"])
+                    scaled_data.sort(key=itemgetter("date"))
                     
                     # Write the updated data
                     write_json(scaled_data, "global_m2.json")
@@ -772,24 +1137,17 @@ def fix_m2_data():
                 else:
                     # Option 2: Start with known values completely
                     print("Existing data insufficient. Using only known reference values.")
-                    write_json(sorted(recent_m2_values, key=lambda x: x["date"]), "global_m2.json")
+                    write_json(sorted(recent_m2_values, key=itemgetter("date")), "global_m2.json")
                     print(f"M2 data replaced with {len(recent_m2_values)} known records.")
             else:
                 # Just update the recent values
                 print("Updating recent M2 values...")
                 
                 # Update with the known recent values
-                for new_item in recent_m2_values:
-                    # Check if this date exists in the existing data
-                    if new_item["date"] in existing_date_map:
-                        # Update the value
-                        existing_data[existing_date_map[new_item["date"]]]["value"] = new_item["value"]
-                    else:
-                        # Add the new item
-                        existing_data.append(new_item)
+                update_by_date(existing_data, recent_m2_values, existing_date_map)
                 
                 # Sort by date
-                existing_data.sort(key=lambda x: x["date"])
+                existing_data.sort(key=itemgetter("date"))
                 
                 # Write the updated data
                 write_json(existing_data, "global_m2.json")
@@ -799,7 +1157,75 @@ def fix_m2_data():
         print(f"Error fixing M2 data: {e}")
 
 
-def main():
+def export_arrow_files():
+    """Export the data files as Arrow IPC (Feather) files next to the JSON files"""
+    if not HAS_PYARROW:
+        print("pyarrow not installed. Cannot export Arrow files.")
+        return
+    
+    print("Exporting Arrow files...")
+    
+    # List of all data files to export
+    data_files = [
+        "bitcoin_price.json",
+        "bitcoin_yoy.json",
+        "global_m2.json",
+        "ism_manufacturing.json",
+        "ism_services.json",
+        "nasdaq.json",
+        "nasdaq_yoy.json",
+        "unemployment_rate.json",
+        "yield_curve.json"
+    ]
+    
+    for filename in data_files:
+        filepath = os.path.join(DATA_DIR, filename)
+        arrow_filename = f"{os.path.splitext(filename)[0]}.arrow"
+        arrow_filepath = os.path.join(DATA_DIR, arrow_filename)
+        
+        # Skip files whose Arrow copy was written after the JSON file last changed
+        with contextlib.suppress(FileNotFoundError):
+            if os.stat(arrow_filepath).st_mtime_ns >= os.stat(filepath).st_mtime_ns:
+                continue
+        
+        data = read_existing_json(filename)
+        if not data:
+            continue
+        
+        try:
+            # Store the columns as timestamp and float64 so readers can use them without parsing
+            df = pd.DataFrame(data, columns=["date", "value"])
+            df["date"] = pd.to_datetime(df["date"], format=DATE_FMT)
+            df["value"] = df["value"].astype("float64")
+            
+            df.to_feather(arrow_filepath, compression="lz4")
+            print(f"Exported {arrow_filename} with {len(df)} records")
+        except Exception as e:
+            print(f"Error exporting {filename}: {e}")
+
+
+async def _update_all():
+    """Run the dataset updaters concurrently, then generate the YoY returns"""
+    loop = asyncio.get_running_loop()
+    
+    # The updaters are blocking and I/O bound, so each one runs on the default
+    # thread pool; they write to separate files and don't depend on each other
+    prices = asyncio.gather(
+        loop.run_in_executor(None, update_bitcoin_price),
+        loop.run_in_executor(None, get_nasdaq_data),
+    )
+    others = asyncio.gather(
+        loop.run_in_executor(None, update_fred_data),
+        loop.run_in_executor(None, update_ism_data),
+    )
+    
+    # YoY returns only depend on the price data, so they don't wait for the rest
+    await prices
+    await loop.run_in_executor(None, generate_yoy_returns)
+    await others
+
+
+def main(export_arrow=False):
     """Main function to run all update processes"""
     print("Starting data update process...")
     
@@ -815,18 +1241,16 @@ def main():
     # Fix the M2 data first with correct values
     fix_m2_data()
     
-    # Update all datasets
-    update_bitcoin_price()
-    update_fred_data()
-    update_ism_data()
-    get_nasdaq_data()
-    
-    # Generate YoY returns after updating price data
-    generate_yoy_returns()
+    # Update all datasets concurrently and generate YoY returns after the price data
+    asyncio.run(_update_all())
     
     # Final integrity check
     check_data_integrity()
     
+    # Export the binary copies of the data files if requested
+    if export_arrow:
+        export_arrow_files()
+    
     print("Data update complete.")
 
 
@@ -852,15 +1276,26 @@ def clean_all_data_files():
                 # Load the data
                 data = read_existing_json(filename)
                 
-                # Clean the data
-                cleaned_data = clean_data_file(data, filename)
+                # Clean the data and sort it by date
+                cleaned_data = clean_data_file(data, filename, sort=True)
+                
+                # Write the cleaned data back to the file if anything was removed or reordered
+                saved = save_json(cleaned_data, filename, data)
                 
-                # Write the cleaned data back to the file
-                write_json(cleaned_data, filename)
+                # The file is now known to be clean and sorted, so the updaters can use it as-is
+                if saved and cleaned_data:
+                    record_sync_cursor(filename, cleaned_data[-1]["date"], len(cleaned_data))
                 
             except Exception as e:
                 print(f"Error cleaning {filename}: {e}")
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Update the economic data files in the data directory")
+    parser.add_argument("--pretty", action="store_true",
+                        help="write indented, human-readable JSON files")
+    parser.add_argument("--arrow", action="store_true",
+                        help="also export the data files as Arrow IPC (.arrow) files")
+    args = parser.parse_args()
+    PRETTY_JSON = args.pretty
+    main(export_arrow=args.arrow)
@@ -6,65 +6,76 @@ This script reads the ISM Manufacturing PMI data from a CSV file
 and updates the JSON file, ensuring there are no duplicates.
 """
 
+import argparse
 import json
 import os
-import csv
-from datetime import datetime
+import pandas as pd
+from operator import itemgetter
 
-def update_ism_manufacturing_from_csv():
-    """Update the ISM Manufacturing JSON with data from the CSV file"""
+# orjson only speeds up JSON handling, so fall back to the json module silently
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def update_ism_manufacturing_from_csv(pretty=False):
+    """
+    Update the ISM Manufacturing JSON with data from the CSV file, written as
+    compact JSON like update_data.py does, or indented if pretty is set
+    """
     print("Updating ISM Manufacturing data from CSV file...")
     
     # Read the existing JSON data
     json_file_path = 'data/ism_manufacturing.json'
-    with open(json_file_path, 'r') as f:
-        existing_data = json.load(f)
+    with open(json_file_path, 'rb') as f:
+        content = f.read()
+    existing_data = orjson.loads(content) if HAS_ORJSON else json.loads(content)
 
     # Create a dictionary of existing data for easy lookup and deduplication
     # Use the date as the key
     existing_dict = {item['date']: item['value'] for item in existing_data}
 
-    # Read the CSV data
+    # Read the CSV data into a series of values indexed by date
     csv_file_path = 'data/ISM-pmi-pm.csv'
-    new_entries = []
-    updated_entries = 0
-    
-    with open(csv_file_path, 'r') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip header row
-        for row in reader:
-            period, value = row
-            # Convert YYYY-MM to YYYY-MM-01 format to match the JSON
-            date_obj = datetime.strptime(period, '%Y-%m')
-            formatted_date = date_obj.strftime('%Y-%m-01')
-            
-            # Only add if the entry doesn't exist
-            if formatted_date not in existing_dict:
-                new_entries.append({
-                    'date': formatted_date,
-                    'value': float(value)
-                })
-            # If it exists but the value is different, update it
-            elif abs(float(value) - existing_dict[formatted_date]) > 0.01:  # Allow for small float differences
-                # Find the entry and update it
-                for item in existing_data:
-                    if item['date'] == formatted_date:
-                        item['value'] = float(value)
-                        updated_entries += 1
-                        break
+    csv_data = pd.read_csv(csv_file_path, header=0, names=['period', 'value'], dtype={'period': str})
+    # Convert YYYY-MM to YYYY-MM-01 format to match the JSON
+    csv_dates = pd.to_datetime(csv_data['period'], format='%Y-%m').dt.strftime('%Y-%m-01')
+    csv_values = pd.Series(csv_data['value'].astype(float).to_numpy(), index=csv_dates)
+    csv_values = csv_values[~csv_values.index.duplicated(keep='last')]
 
-    # Add new entries to existing data
-    existing_data.extend(new_entries)
+    # Line up the existing values with the CSV dates; entries that don't exist
+    # yet are new, and the others are updated only if the value is different
+    # (allowing for small float differences)
+    current_values = pd.Series(existing_dict, dtype=float).reindex(csv_values.index)
+    is_new = current_values.isna()
+    is_updated = ~is_new & ((csv_values - current_values).abs() > 0.01)
+    added_count = int(is_new.sum())
+    updated_count = int(is_updated.sum())
+    
+    # Merge the changes into the dictionary
+    existing_dict.update(csv_values[is_new | is_updated].to_dict())
 
-    # Sort by date
-    existing_data.sort(key=lambda x: x['date'])
+    # Rebuild the list from the dictionary, sorted by date
+    existing_data = sorted(({'date': date, 'value': value} for date, value in existing_dict.items()),
+                           key=itemgetter('date'))
 
-    # Write the updated data back to the JSON file
-    with open(json_file_path, 'w') as f:
-        json.dump(existing_data, f, indent=2)
+    # Serialize once and write the updated data back to the JSON file in a single call
+    if HAS_ORJSON:
+        content = orjson.dumps(existing_data, option=orjson.OPT_INDENT_2 if pretty else None)
+    elif pretty:
+        content = json.dumps(existing_data, indent=2).encode()
+    else:
+        content = json.dumps(existing_data, separators=(",", ":")).encode()
+    with open(json_file_path, 'wb') as f:
+        f.write(content)
 
-    print(f"Added {len(new_entries)} new entries and updated {updated_entries} existing entries.")
+    print(f"Added {added_count} new entries and updated {updated_count} existing entries.")
     print(f"Total entries in ISM Manufacturing data: {len(existing_data)}")
 
 if __name__ == "__main__":
-    update_ism_manufacturing_from_csv() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Update the ISM Manufacturing JSON from the CSV file")
+    parser.add_argument("--pretty", action="store_true",
+                        help="write indented, human-readable JSON like update_data.py --pretty")
+    args = parser.parse_args()
+    update_ism_manufacturing_from_csv(pretty=args.pretty)
\ No newline at end of file